@@ -1,10 +1,23 @@
+import json
+from functools import lru_cache
+
 import mistletoe
 import mistletoe.block_token as b
 import mistletoe.span_token as s
 
 
 def make_block(type_name: str, data: dict | None = None, **kwargs):
-    return [{"object": "block", "type": type_name, type_name: data or {}, **kwargs}]
+    return {"object": "block", "type": type_name, type_name: data or {}, **kwargs}
+
+
+_SPAN_ANNOT = {
+    s.Strong: "bold",
+    s.Emphasis: "italic",
+    s.InlineCode: "code",
+    s.Strikethrough: "strikethrough",
+}
+
+_LINK_TYPES = frozenset({s.AutoLink, s.Link})
 
 
 def spans2text(spans: list[s.SpanToken]):
@@ -14,15 +27,17 @@ def spans2text(spans: list[s.SpanToken]):
         children = []
         child_images = []
         if isinstance(span, s.Image):
-            child_images = make_block(
-                "image",
-                {
-                    "type": "external",
-                    "external": {
-                        "url": span.src,
+            child_images = [
+                make_block(
+                    "image",
+                    {
+                        "type": "external",
+                        "external": {
+                            "url": span.src,
+                        },
                     },
-                },
-            )
+                )
+            ]
         else:
             if hasattr(span, "children") and span.children:
                 children, child_images = spans2text(span.children)
@@ -38,87 +53,79 @@ def spans2text(spans: list[s.SpanToken]):
                     }
                 ]
             # Handle style
-            if isinstance(span, s.Strong):
-                for c in children:
-                    c["annotations"]["bold"] = True
-            elif isinstance(span, s.Emphasis):
-                for c in children:
-                    c["annotations"]["italic"] = True
-            elif isinstance(span, s.InlineCode):
+            annot = _SPAN_ANNOT.get(type(span))
+            if annot:
                 for c in children:
-                    c["annotations"]["code"] = True
-            elif isinstance(span, s.Strikethrough):
-                for c in children:
-                    c["annotations"]["strikethrough"] = True
+                    c["annotations"][annot] = True
             # Handle links
-            if isinstance(span, (s.AutoLink, s.Link)):
+            if type(span) in _LINK_TYPES:
                 for c in children:
                     c["text"]["link"] = {"url": span.target}
                     c["href"] = span.target
-        rich_text += children
-        images += child_images
+        rich_text.extend(children)
+        images.extend(child_images)
     return rich_text, images
 
 
 def heading2notion(block: b.Heading):
     text, images = spans2text(block.children)
-    return (
+    return [
         make_block(
             f"heading_{block.level}",
             {"rich_text": text},
-        )
-        + images
-    )
+        ),
+        *images,
+    ]
 
 
 def quote2notion(block: b.Quote):
     text, images = spans2text(block.children)
-    return (
+    return [
         make_block(
             "quote",
             {"rich_text": text},
-        )
-        + images
-    )
+        ),
+        *images,
+    ]
 
 
 def paragraph2notion(block: b.Paragraph):
     text, images = spans2text(block.children)
-    return (
+    return [
         make_block(
             "paragraph",
             {"rich_text": text},
-        )
-        + images
-    )
+        ),
+        *images,
+    ]
 
 
 def blockcode2notion(block: b.BlockCode):
     text, images = spans2text(block.children)
-    return (
+    return [
         make_block(
             "code",
             {
                 "rich_text": text,
                 "language": block.language or None,
             },
-        )
-        + images
-    )
+        ),
+        *images,
+    ]
 
 
 def codefence2notion(block: b.CodeFence):
     text, images = spans2text(block.children)
-    return (
+    return [
         make_block(
             "code",
             {
                 "rich_text": text,
                 "language": block.language or None,
             },
-        )
-        + images
-    )
+        ),
+        *images,
+    ]
 
 
 def listitem2notion(block: b.ListItem, list_type="bulleted_list_item"):
@@ -137,9 +144,13 @@ def listitem2notion(block: b.ListItem, list_type="bulleted_list_item"):
 def list2notion(block: b.List):
     items = []
     for child in block.children:
-        items += listitem2notion(
-            child,
-            list_type="numbered_list_item" if block.start else "bulleted_list_item",
+        items.append(
+            listitem2notion(
+                child,
+                list_type="numbered_list_item"
+                if block.start
+                else "bulleted_list_item",
+            )
         )
     return items
 
@@ -152,24 +163,24 @@ def tablerow2notion(block: b.TableRow):
 
 
 def table2notion(block: b.Table):
-    rows = tablerow2notion(block.header)
-    table_width = max(
-        len(block.header.children),
-        *[len(row.children) for row in block.children],
-    )
+    rows = [tablerow2notion(block.header)]
+    table_width = len(block.header.children)
     for row in block.children:
-        rows += tablerow2notion(row)
-    return make_block(
-        "table",
-        {
-            "table_width": table_width,
-            "children": rows,
-        },
-    )
+        table_width = max(table_width, len(row.children))
+        rows.append(tablerow2notion(row))
+    return [
+        make_block(
+            "table",
+            {
+                "table_width": table_width,
+                "children": rows,
+            },
+        )
+    ]
 
 
 def break2notion(_: b.ThematicBreak):
-    return make_block("divider")
+    return [make_block("divider")]
 
 
 def html2notion(block: b.HtmlBlock):
@@ -177,26 +188,38 @@ def html2notion(block: b.HtmlBlock):
     return blockcode2notion(block)
 
 
-def md2notion(md: str):
+_BLOCK_DISPATCH = {
+    b.Heading: heading2notion,
+    b.Quote: quote2notion,
+    b.Paragraph: paragraph2notion,
+    b.CodeFence: codefence2notion,
+    b.BlockCode: blockcode2notion,
+    b.List: list2notion,
+    b.Table: table2notion,
+    b.ThematicBreak: break2notion,
+    b.HtmlBlock: html2notion,
+}
+
+
+def _md2notion(md: str):
     doc = mistletoe.Document(md)
     notion_blocks = []
     for child in doc.children:
-        if isinstance(child, b.Heading):
-            notion_blocks += heading2notion(child)
-        elif isinstance(child, b.Quote):
-            notion_blocks += quote2notion(child)
-        elif isinstance(child, b.Paragraph):
-            notion_blocks += paragraph2notion(child)
-        elif isinstance(child, b.CodeFence):
-            notion_blocks += codefence2notion(child)
-        elif isinstance(child, b.BlockCode):
-            notion_blocks += blockcode2notion(child)
-        elif isinstance(child, b.List):
-            notion_blocks += list2notion(child)
-        elif isinstance(child, b.Table):
-            notion_blocks += table2notion(child)
-        elif isinstance(child, b.ThematicBreak):
-            notion_blocks += break2notion(child)
-        elif isinstance(child, b.HtmlBlock):
-            notion_blocks += html2notion(child)
+        handler = _BLOCK_DISPATCH.get(type(child))
+        if handler:
+            notion_blocks.extend(handler(child))
     return notion_blocks
+
+
+@lru_cache(maxsize=256)
+def _md2notion_cached(md: str) -> str:
+    return json.dumps(_md2notion(md))
+
+
+def md2notion(md: str):
+    # Normalize line endings and trailing whitespace so reformatted copies
+    # of the same markdown hit the same cache entry. Cache the serialized
+    # form and deserialize per call so repeated inputs skip the parse but
+    # callers still get a fresh, mutable structure
+    normalized = md.replace("\r\n", "\n").rstrip()
+    return json.loads(_md2notion_cached(normalized))
@@ -1,14 +1,59 @@
+import asyncio
 import concurrent.futures as futures
-import json
 import os
+import time
 from typing import TypedDict
 
+import httpx
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from md2notion import md2notion
 
 API_URL = "https://api.notion.com/v1"
 
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.25,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    ),
+)
+
+# Shared pool for HTTP fetches. Its workers never block on other futures,
+# so it is safe to saturate; blocking work (e.g. formatting that waits on
+# fetches) must run elsewhere
+_IO_POOL = futures.ThreadPoolExecutor(max_workers=32, thread_name_prefix="notion-io")
+
+_HEADERS_JSON: dict | None = None
+_HEADERS_GET: dict | None = None
+
+
+def _get_headers(json_body: bool = True) -> dict:
+    # Built once and reused by reference; GET requests skip Content-Type
+    global _HEADERS_JSON, _HEADERS_GET
+    if _HEADERS_JSON is None:
+        _HEADERS_GET = {
+            "Authorization": f"Bearer {os.environ['NOTION_INTEGRATION_SECRET']}",
+            "Notion-Version": "2022-06-28",
+        }
+        _HEADERS_JSON = {**_HEADERS_GET, "Content-Type": "application/json"}
+    return _HEADERS_JSON if json_body else _HEADERS_GET
+
+
+def _refresh_headers() -> None:
+    # Drop the cached headers so the next request re-reads the secret,
+    # e.g. after rotating NOTION_INTEGRATION_SECRET
+    global _HEADERS_JSON, _HEADERS_GET
+    _HEADERS_JSON = _HEADERS_GET = None
+
 
 class NotionSearchResult(TypedDict):
     id: str
@@ -25,6 +70,12 @@ def _get_post_title(post: dict):
         return title_obj[0].get("plain_text")
 
 
+# Short-lived memo for repeated searches, e.g. duplicate UI-driven queries
+_SEARCH_CACHE: dict[tuple[str, int], tuple[float, list[NotionSearchResult]]] = {}
+_SEARCH_CACHE_TTL = 2.0
+_SEARCH_CACHE_MAX = 128
+
+
 def search_titles(query: str = "", num_results: int = 10) -> list[NotionSearchResult]:
     """
     Search Notion pages by titles
@@ -43,10 +94,17 @@ def search_titles(query: str = "", num_results: int = 10) -> list[NotionSearchRe
         - url (str): Page URL that requires authentication
         - public_url (str): Public page URL if page is published
     """
-    page_size = min(num_results, 100)
+    cache_key = (query, num_results)
+    cached = _SEARCH_CACHE.get(cache_key)
+    if cached and time.monotonic() - cached[0] < _SEARCH_CACHE_TTL:
+        return list(cached[1])
+
+    # Always request the max page size; the round-trip costs the same and
+    # the surplus is sliced off locally
+    page_size = 100
     results = []
-    start_cursor = None
-    while len(results) < num_results:
+
+    def _post_page(start_cursor: str | None):
         data = {
             "query": query,
             "sort": {
@@ -57,31 +115,58 @@ def search_titles(query: str = "", num_results: int = 10) -> list[NotionSearchRe
         }
         if start_cursor:
             data["start_cursor"] = start_cursor
-        response = requests.post(
+        return _SESSION.post(
             API_URL + "/search",
-            headers={
-                "Authorization": f"Bearer {os.environ['NOTION_INTEGRATION_SECRET']}",
-                "Content-Type": "application/json",
-                "Notion-Version": "2022-06-28",
-            },
-            data=json.dumps(data),
+            headers=_get_headers(),
+            data=orjson.dumps(data),
         )
-        response_json = response.json()
-        results += [
-            NotionSearchResult(
-                id=r.get("id"),
-                created_at=r.get("created_time"),
-                modified_at=r.get("last_edited_time"),
-                title=_get_post_title(r),
-                url=r.get("url"),
-                public_url=r.get("public_url"),
+
+    prefetch_pool = None
+    try:
+        response = _post_page(None)
+        while True:
+            response_json = orjson.loads(response.content)
+            new_results = response_json.get("results", [])
+            # Prefetch the next page before parsing this one so the next
+            # round-trip overlaps with Python-side work
+            in_flight = None
+            next_cursor = response_json.get("next_cursor")
+            if (
+                response_json.get("has_more")
+                and next_cursor
+                and len(results) + len(new_results) < num_results
+            ):
+                if prefetch_pool is None:
+                    prefetch_pool = futures.ThreadPoolExecutor(max_workers=1)
+                in_flight = prefetch_pool.submit(_post_page, next_cursor)
+            # Dict literals: TypedDict calls don't validate and cost an
+            # extra function call per result
+            results.extend(
+                {
+                    "id": r.get("id"),
+                    "created_at": r.get("created_time"),
+                    "modified_at": r.get("last_edited_time"),
+                    "title": _get_post_title(r),
+                    "url": r.get("url"),
+                    "public_url": r.get("public_url"),
+                }
+                for r in new_results
             )
-            for r in response_json.get("results", [])
-        ]
-        if not response_json.get("has_more") or not response_json.get("next_cursor"):
-            break
-        start_cursor = response_json.get("next_cursor")
-    return results[:num_results]
+            if len(results) >= num_results:
+                if in_flight is not None:
+                    in_flight.cancel()
+                break
+            if in_flight is None:
+                break
+            response = in_flight.result()
+    finally:
+        if prefetch_pool is not None:
+            prefetch_pool.shutdown(wait=False)
+    results = results[:num_results]
+    if len(_SEARCH_CACHE) >= _SEARCH_CACHE_MAX:
+        _SEARCH_CACHE.clear()
+    _SEARCH_CACHE[cache_key] = (time.monotonic(), results)
+    return list(results)
 
 
 class NotionBlock(TypedDict):
@@ -94,46 +179,99 @@ class NotionBlock(TypedDict):
     children: list["NotionBlock"]
 
 
-def _get_block_children(block_id: str, num_blocks: int = 100):
+def _fetch_block_dicts(block_id: str, num_blocks: int = 100) -> list[dict]:
     page_size = min(num_blocks, 100)
-    blocks = []
-    start_cursor = None
-    while len(blocks) < num_blocks:
+    block_dicts = []
+
+    def _get_page(start_cursor: str | None):
         url = API_URL + f"/blocks/{block_id}/children?page_size={page_size}"
         if start_cursor:
             url += f"&start_cursor={start_cursor}"
-        response = requests.get(
+        return _SESSION.get(
             url,
-            headers={
-                "Authorization": f"Bearer {os.environ['NOTION_INTEGRATION_SECRET']}",
-                "Notion-Version": "2022-06-28",
-            },
+            headers=_get_headers(json_body=False),
         )
-        response_json = response.json()
-        with futures.ThreadPoolExecutor() as pool:
-            new_blocks = pool.map(
-                _dict_to_notion_block, response_json.get("results", [])
-            )
-        blocks += new_blocks
-        if not response_json.get("has_more") or not response_json.get("next_cursor"):
-            break
-        start_cursor = response_json.get("next_cursor")
+
+    prefetch_pool = None
+    try:
+        response = _get_page(None)
+        while True:
+            response_json = orjson.loads(response.content)
+            new_block_dicts = response_json.get("results", [])
+            # Prefetch the next page before parsing this one so the next
+            # round-trip overlaps with Python-side work
+            in_flight = None
+            next_cursor = response_json.get("next_cursor")
+            if (
+                response_json.get("has_more")
+                and next_cursor
+                and len(block_dicts) + len(new_block_dicts) < num_blocks
+            ):
+                if prefetch_pool is None:
+                    prefetch_pool = futures.ThreadPoolExecutor(max_workers=1)
+                in_flight = prefetch_pool.submit(_get_page, next_cursor)
+            block_dicts += new_block_dicts
+            if len(block_dicts) >= num_blocks:
+                if in_flight is not None:
+                    in_flight.cancel()
+                break
+            if in_flight is None:
+                break
+            response = in_flight.result()
+    finally:
+        if prefetch_pool is not None:
+            prefetch_pool.shutdown(wait=False)
+    return block_dicts
+
+
+def _has_fetchable_children(block: NotionBlock) -> bool:
+    return block["has_children"] and block["type"] != "child_page"
+
+
+def _resolve_block_tree(
+    pool: futures.ThreadPoolExecutor, blocks: list[NotionBlock]
+) -> list[NotionBlock]:
+    # Breadth-first: fetch every children-bearing block at the current depth
+    # concurrently, then repeat for the next depth
+    pending = [
+        (block, pool.submit(_fetch_block_dicts, block["id"]))
+        for block in blocks
+        if _has_fetchable_children(block)
+    ]
+    while pending:
+        next_pending = []
+        for block, future in pending:
+            children = [_dict_to_notion_block(d) for d in future.result()]
+            block["children"] = children
+            next_pending += [
+                (child, pool.submit(_fetch_block_dicts, child["id"]))
+                for child in children
+                if _has_fetchable_children(child)
+            ]
+        pending = next_pending
     return blocks
 
 
+def _get_block_children(block_id: str, num_blocks: int = 100) -> list[NotionBlock]:
+    blocks = [
+        _dict_to_notion_block(d) for d in _fetch_block_dicts(block_id, num_blocks)
+    ]
+    return _resolve_block_tree(_IO_POOL, blocks)
+
+
 def _dict_to_notion_block(block_dict: dict) -> NotionBlock:
-    block = NotionBlock(
-        id=block_dict.get("id"),
-        created_at=block_dict.get("created_time"),
-        modified_at=block_dict.get("last_edited_time"),
-        type=block_dict.get("type"),
-        data=block_dict.get(block_dict.get("type"), None),
-        has_children=block_dict.get("has_children", False),
-        children=[],
-    )
-    if block_dict.get("has_children") and block_dict.get("type") != "child_page":
-        block["children"] = _get_block_children(block_dict.get("id"))
-    return block
+    # Index always-present keys directly; .get only where the key may be
+    # missing (e.g. "unsupported" blocks have no payload under their type)
+    block_type = block_dict["type"]
+    return {
+        "id": block_dict["id"],
+        "created_at": block_dict["created_time"],
+        "modified_at": block_dict["last_edited_time"],
+        "type": block_type,
+        "data": block_dict.get(block_type),
+        "has_children": block_dict.get("has_children", False),
+        "children": [],
+    }
 
 
 def _rich_text_arr_to_text(arr: list[dict] | None) -> str:
@@ -150,102 +288,191 @@ def _rich_text_arr_to_text(arr: list[dict] | None) -> str:
     return "".join(texts)
 
 
-def _format_children(block_dict: dict) -> str:
-    text = ""
-    if block_dict.get("has_children"):
-        child_blocks = block_dict.get("children", [])
-        for i, block in enumerate(child_blocks):
-            block_text = _block_dict_to_text(block, i)
-            text += "\n\t" + block_text.replace("\n", "\n\t")
-    return text
+def _fmt_empty(block_dict: dict, pos: int) -> str:
+    return ""
 
 
-def _block_dict_to_text(block_dict: dict, pos: int = 0) -> str:
-    block_type = block_dict.get("type")
+def _fmt_bookmark(block_dict: dict, pos: int) -> str:
     data = block_dict.get("data", {})
-    if block_type == "bookmark":
-        caption = _rich_text_arr_to_text(data.get("caption"))
-        url = data.get("url", "")
-        return f"[{caption}]({url})"
-    if block_type == "breadcrumb":
-        return ""
-    if block_type == "bulleted_list_item":
-        text = "- " + _rich_text_arr_to_text(data.get("rich_text"))
-        return text + _format_children(block_dict)
-    if block_type == "callout":
-        return _rich_text_arr_to_text(data.get("rich_text"))
-    if block_type == "child_database":
-        return f"[{data.get('title')}](page_id={block_dict.get('id')})"
-    if block_type == "child_page":
-        return f"[{data.get('title')}](page_id={block_dict.get('id')})"
-    if block_type == "code":
-        return f"```{data.get('language')}\n{_rich_text_arr_to_text(data.get('rich_text'))}\n```"
-    if block_type == "column_list":
-        return _format_children(block_dict)
-    if block_type == "divider":
-        return "---"
-    if block_type == "embed":
-        url = data.get("url", "")
-        return f"[{url}]({url})"
-    if block_type == "equation":
-        return data.get("expression", "")
-    if block_type == "file":
-        caption = _rich_text_arr_to_text(data.get("caption"))
-        name = data.get("name")
-        url = data.get("url", "")
-        return f"[{caption or name or url}]({url})"
-    if block_type.startswith("heading"):
-        heading_size = int(block_type.replace("heading_", ""))
-        text = _rich_text_arr_to_text(data.get("rich_text"))
-        text = "#" * heading_size + f" {text}"
-        return text + _format_children(block_dict)
-    if block_type == "image":
-        image_type = data.get("type")
-        url = data.get(image_type, {}).get("url")
-        return f"![{url}]({url})"
-    if block_type == "link_preview":
-        url = data.get("url", "")
-        return f"[{url}]({url})"
-    if block_type == "mention":
-        return _block_dict_to_text(data)
-    if block_type == "numbered_list_item":
-        text = f"{pos+1}. " + _rich_text_arr_to_text(data.get("rich_text"))
-        return text + _format_children(block_dict)
-    if block_type == "paragraph":
-        text = _rich_text_arr_to_text(data.get("rich_text"))
-        return text + _format_children(block_dict)
-    if block_type == "pdf":
-        image_type = data.get("type")
-        url = data.get(image_type, {}).get("url")
-        return f"![{url}]({url})"
-    if block_type == "quote":
-        text = "> " + _rich_text_arr_to_text(data.get("rich_text"))
-        return text + _format_children(block_dict)
-    if block_type == "synced_block":
-        # TODO - Handle duplicate synced block
-        return _format_children(block_dict)
-    if block_type == "table":
-        # TODO - Retrieve full table
-        return f"[Table](table_id={block_dict.get('id')})"
-    if block_type == "table_of_contents":
-        pass
-    if block_type == "to_do":
-        if data.get("checked"):
-            prefix = "- [x]"
-        else:
-            prefix = "- [ ]"
-        text = prefix + _rich_text_arr_to_text(data.get("rich_text"))
-        return text + _format_children(block_dict)
-    if block_type == "toggle":
-        text = _rich_text_arr_to_text(data.get("rich_text"))
-        return text + _format_children(block_dict)
-    if block_type == "video":
-        image_type = data.get("type")
-        url = data.get(image_type, {}).get("url")
-        return f"![{url}]({url})"
+    caption = _rich_text_arr_to_text(data.get("caption"))
+    url = data.get("url", "")
+    return f"[{caption}]({url})"
+
+
+def _fmt_bulleted(block_dict: dict, pos: int) -> str:
+    data = block_dict.get("data", {})
+    return "- " + _rich_text_arr_to_text(data.get("rich_text"))
+
+
+def _fmt_callout(block_dict: dict, pos: int) -> str:
+    data = block_dict.get("data", {})
+    return _rich_text_arr_to_text(data.get("rich_text"))
+
+
+def _fmt_child_page(block_dict: dict, pos: int) -> str:
+    data = block_dict.get("data", {})
+    return f"[{data.get('title')}](page_id={block_dict.get('id')})"
+
+
+def _fmt_code(block_dict: dict, pos: int) -> str:
+    data = block_dict.get("data", {})
+    return f"```{data.get('language')}\n{_rich_text_arr_to_text(data.get('rich_text'))}\n```"
+
+
+def _fmt_children_only(block_dict: dict, pos: int) -> str:
     return ""
 
 
+def _fmt_divider(block_dict: dict, pos: int) -> str:
+    return "---"
+
+
+def _fmt_url(block_dict: dict, pos: int) -> str:
+    url = block_dict.get("data", {}).get("url", "")
+    return f"[{url}]({url})"
+
+
+def _fmt_equation(block_dict: dict, pos: int) -> str:
+    return block_dict.get("data", {}).get("expression", "")
+
+
+def _fmt_file(block_dict: dict, pos: int) -> str:
+    data = block_dict.get("data", {})
+    caption = _rich_text_arr_to_text(data.get("caption"))
+    name = data.get("name")
+    url = data.get("url", "")
+    return f"[{caption or name or url}]({url})"
+
+
+def _fmt_heading(block_dict: dict, pos: int) -> str:
+    heading_size = int(block_dict.get("type")[-1])
+    data = block_dict.get("data", {})
+    text = _rich_text_arr_to_text(data.get("rich_text"))
+    return "#" * heading_size + f" {text}"
+
+
+def _fmt_media(block_dict: dict, pos: int) -> str:
+    data = block_dict.get("data", {})
+    media_type = data.get("type")
+    url = data.get(media_type, {}).get("url")
+    return f"![{url}]({url})"
+
+
+def _fmt_mention(block_dict: dict, pos: int) -> str:
+    return _block_dict_to_text(block_dict.get("data", {}))
+
+
+def _fmt_numbered(block_dict: dict, pos: int) -> str:
+    data = block_dict.get("data", {})
+    return f"{pos+1}. " + _rich_text_arr_to_text(data.get("rich_text"))
+
+
+def _fmt_paragraph(block_dict: dict, pos: int) -> str:
+    data = block_dict.get("data", {})
+    return _rich_text_arr_to_text(data.get("rich_text"))
+
+
+def _fmt_quote(block_dict: dict, pos: int) -> str:
+    data = block_dict.get("data", {})
+    return "> " + _rich_text_arr_to_text(data.get("rich_text"))
+
+
+def _fmt_table(block_dict: dict, pos: int) -> str:
+    # TODO - Retrieve full table
+    return f"[Table](table_id={block_dict.get('id')})"
+
+
+def _fmt_to_do(block_dict: dict, pos: int) -> str:
+    data = block_dict.get("data", {})
+    if data.get("checked"):
+        prefix = "- [x]"
+    else:
+        prefix = "- [ ]"
+    return prefix + _rich_text_arr_to_text(data.get("rich_text"))
+
+
+def _fmt_toggle(block_dict: dict, pos: int) -> str:
+    data = block_dict.get("data", {})
+    return _rich_text_arr_to_text(data.get("rich_text"))
+
+
+_BLOCK_FORMATTERS = {
+    "bookmark": _fmt_bookmark,
+    "breadcrumb": _fmt_empty,
+    "bulleted_list_item": _fmt_bulleted,
+    "callout": _fmt_callout,
+    "child_database": _fmt_child_page,
+    "child_page": _fmt_child_page,
+    "code": _fmt_code,
+    "column_list": _fmt_children_only,
+    "divider": _fmt_divider,
+    "embed": _fmt_url,
+    "equation": _fmt_equation,
+    "file": _fmt_file,
+    "heading_1": _fmt_heading,
+    "heading_2": _fmt_heading,
+    "heading_3": _fmt_heading,
+    "image": _fmt_media,
+    "link_preview": _fmt_url,
+    "mention": _fmt_mention,
+    "numbered_list_item": _fmt_numbered,
+    "paragraph": _fmt_paragraph,
+    "pdf": _fmt_media,
+    "quote": _fmt_quote,
+    # TODO - Handle duplicate synced block
+    "synced_block": _fmt_children_only,
+    "table": _fmt_table,
+    "table_of_contents": _fmt_empty,
+    "to_do": _fmt_to_do,
+    "toggle": _fmt_toggle,
+    "video": _fmt_media,
+}
+
+# Types whose children are rendered as indented lines under the block
+_CHILD_BEARING = frozenset(
+    {
+        "bulleted_list_item",
+        "column_list",
+        "heading_1",
+        "heading_2",
+        "heading_3",
+        "numbered_list_item",
+        "paragraph",
+        "quote",
+        "synced_block",
+        "to_do",
+        "toggle",
+    }
+)
+
+
+def _emit(block_dict: dict, pos: int, out: list[str], indent: str) -> None:
+    # Append this block's text (re-indented) and its children to out,
+    # avoiding intermediate per-subtree strings
+    block_type = block_dict.get("type")
+    formatter = _BLOCK_FORMATTERS.get(block_type, _fmt_empty)
+    text = formatter(block_dict, pos)
+    out.append(text.replace("\n", "\n" + indent) if indent else text)
+    if block_type in _CHILD_BEARING and block_dict.get("has_children"):
+        child_indent = indent + "\t"
+        for i, child in enumerate(block_dict.get("children", [])):
+            out.append("\n" + child_indent)
+            _emit(child, i, out, child_indent)
+
+
+def _block_dict_to_text(block_dict: dict, pos: int = 0) -> str:
+    out: list[str] = []
+    _emit(block_dict, pos, out, "")
+    return "".join(out)
+
+
+def _resolve_and_format(
+    pool: futures.ThreadPoolExecutor, block: NotionBlock, pos: int
+) -> str:
+    _resolve_block_tree(pool, [block])
+    return _block_dict_to_text(block, pos)
+
+
 def get_page_blocks(page_id: str, num_blocks: int = 100) -> list[NotionBlock]:
     """
     Retrieves a list of blocks for a page
@@ -277,8 +504,19 @@ def get_page_text(page_id: str, num_blocks: int = 100) -> str:
     Returns:
         A string representing the page content
     """
-    blocks = _get_block_children(page_id, num_blocks)
-    return "\n".join(_block_dict_to_text(b, i) for i, b in enumerate(blocks))
+    blocks = [
+        _dict_to_notion_block(d) for d in _fetch_block_dicts(page_id, num_blocks)
+    ]
+    # Resolve and format each top-level subtree on its own worker so
+    # formatting starts as soon as that subtree's children arrive, instead
+    # of after the whole tree is fetched. Formatting workers block on
+    # fetches, so they get their own short-lived pool rather than _IO_POOL
+    with futures.ThreadPoolExecutor(max_workers=8) as fmt_pool:
+        text_futures = [
+            fmt_pool.submit(_resolve_and_format, _IO_POOL, block, i)
+            for i, block in enumerate(blocks)
+        ]
+        return "\n".join(future.result() for future in text_futures)
 
 
 def create_page(parent_id: str, title: str, content: str) -> str:
@@ -305,17 +543,13 @@ def create_page(parent_id: str, title: str, content: str) -> str:
         },
         "children": md2notion(content),
     }
-    response = requests.post(
+    response = _SESSION.post(
         API_URL + "/pages",
-        headers={
-            "Authorization": f"Bearer {os.environ['NOTION_INTEGRATION_SECRET']}",
-            "Content-Type": "application/json",
-            "Notion-Version": "2022-06-28",
-        },
-        data=json.dumps(data),
+        headers=_get_headers(),
+        data=orjson.dumps(data),
     )
     if response.ok:
-        response_json = response.json()
+        response_json = orjson.loads(response.content)
         return f"Page created with ID {response_json.get('id')}"
     else:
         return "Something went wrong"
@@ -339,18 +573,105 @@ def insert_paragraph(
     data = {"children": md2notion(content)}
     if after_block_id:
         data["after"] = after_block_id
-    response = requests.patch(
+    response = _SESSION.patch(
         API_URL + f"/blocks/{parent_id}/children",
-        headers={
-            "Authorization": f"Bearer {os.environ['NOTION_INTEGRATION_SECRET']}",
-            "Content-Type": "application/json",
-            "Notion-Version": "2022-06-28",
-        },
-        data=json.dumps(data),
+        headers=_get_headers(),
+        data=orjson.dumps(data),
     )
     if response.ok:
-        response_json = response.json()
+        response_json = orjson.loads(response.content)
         blocks = response_json.get("results", [])
         if len(blocks):
             return f"Paragraph inserted with ID {blocks[0].get('id')}"
     return "Something went wrong"
+
+
+# Async variants. A single HTTP/2 connection multiplexes all child-block
+# fetches, so tree traversal needs neither threads nor extra sockets
+
+
+def _aclient() -> httpx.AsyncClient:
+    return httpx.AsyncClient(http2=True)
+
+
+async def _afetch_block_dicts(
+    client: httpx.AsyncClient, block_id: str, num_blocks: int = 100
+) -> list[dict]:
+    page_size = min(num_blocks, 100)
+    block_dicts = []
+    start_cursor = None
+    while len(block_dicts) < num_blocks:
+        url = API_URL + f"/blocks/{block_id}/children?page_size={page_size}"
+        if start_cursor:
+            url += f"&start_cursor={start_cursor}"
+        response = await client.get(url, headers=_get_headers(json_body=False))
+        response_json = orjson.loads(response.content)
+        block_dicts += response_json.get("results", [])
+        if len(block_dicts) >= num_blocks:
+            break
+        if not response_json.get("has_more") or not response_json.get("next_cursor"):
+            break
+        start_cursor = response_json.get("next_cursor")
+    return block_dicts
+
+
+async def _aget_block_children(
+    client: httpx.AsyncClient, block_id: str, num_blocks: int = 100
+) -> list[NotionBlock]:
+    block_dicts = await _afetch_block_dicts(client, block_id, num_blocks)
+    blocks = [_dict_to_notion_block(d) for d in block_dicts]
+    parents = [block for block in blocks if _has_fetchable_children(block)]
+    child_lists = await asyncio.gather(
+        *[_aget_block_children(client, parent["id"]) for parent in parents]
+    )
+    for parent, children in zip(parents, child_lists):
+        parent["children"] = children
+    return blocks
+
+
+async def aget_page_blocks(page_id: str, num_blocks: int = 100) -> list[NotionBlock]:
+    """
+    Async variant of get_page_blocks; see get_page_blocks for arguments
+    and return format
+    """
+    async with _aclient() as client:
+        return await _aget_block_children(client, page_id, num_blocks)
+
+
+async def aget_page_text(page_id: str, num_blocks: int = 100) -> str:
+    """
+    Async variant of get_page_text; see get_page_text for arguments
+    and return format
+    """
+    async with _aclient() as client:
+        blocks = await _aget_block_children(client, page_id, num_blocks)
+    return "\n".join(_block_dict_to_text(b, i) for i, b in enumerate(blocks))
+
+
+async def acreate_page(parent_id: str, title: str, content: str) -> str:
+    """
+    Async variant of create_page; see create_page for arguments
+    and return format
+    """
+    data = {
+        "parent": {"page_id": parent_id},
+        "properties": {
+            "title": {
+                "id": "title",
+                "type": "title",
+                "title": [{"type": "text", "text": {"content": title}}],
+            }
+        },
+        "children": md2notion(content),
+    }
+    async with _aclient() as client:
+        response = await client.post(
+            API_URL + "/pages",
+            headers=_get_headers(),
+            content=orjson.dumps(data),
+        )
+    if response.is_success:
+        response_json = orjson.loads(response.content)
+        return f"Page created with ID {response_json.get('id')}"
+    else:
+        return "Something went wrong"